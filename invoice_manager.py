@@ -6,92 +6,136 @@ sale and restock invoices in the WeCare Skin Care Product System.
 """
 
 import os
-from datetime import datetime
 
-def make_invoice_filename(invoice_dir, prefix):
-    """Create a unique invoice filename."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+# Invoice table separators
+SEP85 = "-" * 85 + "\n"
+SEP80 = "-" * 80 + "\n"
+
+# Sale invoice layout
+SALE_HEADER = "=== WeCare Skin Care - Sale Invoice ===\n\n"
+SALE_COL_HEADER = (
+    f"{'ID':<5} {'Product':<20} {'Brand':<15} {'Qty':<8} {'Free':<8} "
+    f"{'Price(Rs)':<12} {'Total(Rs)':<12}\n"
+)
+SALE_ROW_FMT = "{:<5} {:<20} {:<15} {:<8} {:<8} {:<12.2f} {:<12.2f}\n"
+SALE_ROW = SALE_ROW_FMT.format
+SALE_FOOTER = "\nThank you for shopping with WeCare!"
+
+# Restock invoice layout
+RESTOCK_HEADER = "=== WeCare Skin Care - Restock Invoice ===\n\n"
+RESTOCK_COL_HEADER = (
+    f"{'ID':<5} {'Product':<20} {'Brand':<15} {'Qty':<8} "
+    f"{'Cost(Rs)':<15} {'Total(Rs)':<15}\n"
+)
+RESTOCK_ROW_FMT = "{:<5} {:<20} {:<15} {:<8} {:<15.2f} {:<15.2f}\n"
+RESTOCK_ROW = RESTOCK_ROW_FMT.format
+RESTOCK_FOOTER = "\nThank you for your business!"
+
+def make_invoice_filename(invoice_dir, prefix, date):
+    """Create a unique invoice filename from the invoice date."""
+    timestamp = date.strftime("%Y%m%d_%H%M%S")
     return os.path.join(invoice_dir, f"{prefix}_{timestamp}.txt")
 
-def write_sale_invoice(invoice_dir, invoice_data):
-    """Write a sale invoice to file."""
-    filename = make_invoice_filename(invoice_dir, "sale")
+def save_invoice(filename, parts):
+    """Write the collected invoice text to file in a single write."""
     with open(filename, 'w', encoding='utf-8') as file:
-        # Write header
-        file.write("=== WeCare Skin Care - Sale Invoice ===\n\n")
-        file.write(f"Date: {invoice_data['date'].strftime('%Y-%m-%d %H:%M:%S')}\n")
-        file.write(f"Customer: {invoice_data['customer_name']}\n\n")
-
-        # Write items header
-        file.write("Items Purchased:\n")
-        file.write("-" * 85 + "\n")
-        file.write(
-            f"{'ID':<5} {'Product':<20} {'Brand':<15} {'Qty':<8} {'Free':<8} "
-            f"{'Price(Rs)':<12} {'Total(Rs)':<12}\n"
+        file.write(''.join(parts))
+
+def sale_rows(items):
+    """Yield the formatted table rows for sale invoice items."""
+    row = SALE_ROW
+    for item in items:
+        yield row(
+            item['id'], item['name'], item['brand'],
+            item['quantity'], item['free_items'],
+            item['price'], item['total']
         )
-        file.write("-" * 85 + "\n")
 
-        # Write items
-        for item in invoice_data['items']:
-            file.write(
-                f"{item['id']:<5} {item['name']:<20} {item['brand']:<15} "
-                f"{item['quantity']:<8} {item['free_items']:<8} "
-                f"{item['price']:<12.2f} {item['total']:<12.2f}\n"
-            )
+def restock_rows(items):
+    """Yield the formatted table rows for restock invoice items."""
+    row = RESTOCK_ROW
+    for item in items:
+        item_total = item['quantity'] * item['cost_price']
+        yield row(
+            item['id'] if item['id'] else 'NEW', item['name'],
+            item['brand'], item['quantity'],
+            item['cost_price'], item_total
+        )
+
+def write_sale_invoice(invoice_dir, invoice_data):
+    """Write a sale invoice to file."""
+    date = invoice_data['date']
+    filename = make_invoice_filename(invoice_dir, "sale", date)
+    parts = []
+    append = parts.append
+
+    # Header
+    append(SALE_HEADER)
+    append(f"Date: {date.isoformat(sep=' ', timespec='seconds')}\n")
+    append(f"Customer: {invoice_data['customer_name']}\n\n")
+
+    # Items header
+    append("Items Purchased:\n")
+    append(SEP85)
+    append(SALE_COL_HEADER)
+    append(SEP85)
+
+    # Items
+    parts.extend(sale_rows(invoice_data['items']))
 
-        # Write footer
-        file.write("-" * 85 + "\n")
-        file.write(f"Total Amount: Rs. {invoice_data['total_amount']:.2f}\n")
-        file.write("\nThank you for shopping with WeCare!")
+    # Footer
+    append(SEP85)
+    append(f"Total Amount: Rs. {invoice_data['total_amount']:.2f}\n")
+    append(SALE_FOOTER)
+
+    save_invoice(filename, parts)
 
 def write_restock_invoice(invoice_dir, invoice_data):
     """Write a restock invoice to file."""
-    filename = make_invoice_filename(invoice_dir, "restock")
-    with open(filename, 'w', encoding='utf-8') as file:
-        # Write header
-        file.write("=== WeCare Skin Care - Restock Invoice ===\n\n")
-        file.write(f"Date: {invoice_data['date'].strftime('%Y-%m-%d %H:%M:%S')}\n")
-        file.write(f"Supplier: {invoice_data['supplier_name']}\n\n")
-
-        # Write items header
-        file.write("Items Restocked:\n")
-        file.write("-" * 80 + "\n")
-        file.write(
-            f"{'ID':<5} {'Product':<20} {'Brand':<15} {'Qty':<8} "
-            f"{'Cost(Rs)':<15} {'Total(Rs)':<15}\n"
-        )
-        file.write("-" * 80 + "\n")
-
-        # Write items
-        for item in invoice_data['items']:
-            item_total = item['quantity'] * item['cost_price']
-            file.write(
-                f"{item['id'] if item['id'] else 'NEW':<5} {item['name']:<20} "
-                f"{item['brand']:<15} {item['quantity']:<8} "
-                f"{item['cost_price']:<15.2f} {item_total:<15.2f}\n"
-            )
-
-        # Write footer
-        file.write("-" * 80 + "\n")
-        file.write(f"Total Cost: Rs. {invoice_data['total_amount']:.2f}\n")
-        file.write("\nThank you for your business!")
+    date = invoice_data['date']
+    filename = make_invoice_filename(invoice_dir, "restock", date)
+    parts = []
+    append = parts.append
+
+    # Header
+    append(RESTOCK_HEADER)
+    append(f"Date: {date.isoformat(sep=' ', timespec='seconds')}\n")
+    append(f"Supplier: {invoice_data['supplier_name']}\n\n")
+
+    # Items header
+    append("Items Restocked:\n")
+    append(SEP80)
+    append(RESTOCK_COL_HEADER)
+    append(SEP80)
+
+    # Items
+    parts.extend(restock_rows(invoice_data['items']))
+
+    # Footer
+    append(SEP80)
+    append(f"Total Cost: Rs. {invoice_data['total_amount']:.2f}\n")
+    append(RESTOCK_FOOTER)
+
+    save_invoice(filename, parts)
+
+class InvoiceManager:
+    """Generates invoices into an invoice directory."""
+
+    __slots__ = ('invoice_dir',)
+
+    def __init__(self, invoice_dir):
+        self.invoice_dir = invoice_dir
+        # Create invoices directory if it doesn't exist
+        os.makedirs(invoice_dir, exist_ok=True)
+
+    def generate_sale_invoice(self, invoice_data):
+        """Write a sale invoice."""
+        write_sale_invoice(self.invoice_dir, invoice_data)
+
+    def generate_restock_invoice(self, invoice_data):
+        """Write a restock invoice."""
+        write_restock_invoice(self.invoice_dir, invoice_data)
 
 def create_invoice_manager():
     """Create an invoice manager."""
-    # Create invoices directory if it doesn't exist
-    invoice_dir = "invoices"
-    if not os.path.exists(invoice_dir):
-        os.makedirs(invoice_dir)
-
-    # Create the manager functions
-    def handle_sale_invoice(invoice_data):
-        write_sale_invoice(invoice_dir, invoice_data)
-
-    def handle_restock_invoice(invoice_data):
-        write_restock_invoice(invoice_dir, invoice_data)
-
-    # Return the manager functions
-    return {
-        'generate_sale_invoice': handle_sale_invoice,
-        'generate_restock_invoice': handle_restock_invoice
-    }
+    return InvoiceManager("invoices")
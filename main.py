@@ -9,21 +9,22 @@ from datetime import datetime
 import product_manager
 import invoice_manager
 
-# Constants
-MARKUP_PERCENTAGE = 200  # 200% markup
-
-def get_valid_input(prompt, input_type=str, min_value=None, allow_zero=False):
+# Product table layout
+PRODUCT_COL_HEADER = (
+    f"{'ID':<5} {'Name':<20} {'Brand':<15} {'Stock':<10} {'Price(Rs)':<15} {'Origin':<15}"
+)
+PRODUCT_ROW_FMT = "{:<5} {:<20} {:<15} {:<10} {:<15.2f} {:<15}"
+PRODUCT_SEP = "-" * 80
+
+def get_str(prompt):
     """
-    Helper function to get and validate user input.
-    
+    Get a non-empty string from the user.
+
     Args:
         prompt (str): The prompt message to display
-        input_type (type): The type of input expected (str, int, or float)
-        min_value (float/int): Minimum allowed value for numeric inputs
-        allow_zero (bool): Whether to allow zero as a valid input for numeric types
-    
+
     Returns:
-        The validated input of the specified type
+        str: The entered text with surrounding whitespace removed
     """
     while True:
         value = input(prompt).strip()
@@ -32,18 +33,74 @@ def get_valid_input(prompt, input_type=str, min_value=None, allow_zero=False):
             print("Error: Input cannot be empty")
             continue
 
-        if input_type in (int, float):
-            try:
-                value = input_type(value)
-                if min_value is not None and value < min_value:
-                    print(f"Error: Value must be greater than {min_value}")
-                    continue
-                if not allow_zero and value == 0:
-                    print("Error: Value cannot be zero")
-                    continue
-            except ValueError:
-                print(f"Error: Please enter a valid {input_type.__name__}")
-                continue
+        return value
+
+def get_int(prompt, min_value=None):
+    """
+    Get a non-zero integer from the user.
+
+    Args:
+        prompt (str): The prompt message to display
+        min_value (int): Minimum allowed value
+
+    Returns:
+        int: The validated integer
+    """
+    while True:
+        # int() ignores surrounding whitespace, so the raw input is parsed as is
+        value = input(prompt)
+
+        if not value or value.isspace():
+            print("Error: Input cannot be empty")
+            continue
+
+        try:
+            value = int(value)
+        except ValueError:
+            print("Error: Please enter a valid int")
+            continue
+
+        if min_value is not None and value < min_value:
+            print(f"Error: Value must be greater than {min_value}")
+            continue
+        if value == 0:
+            print("Error: Value cannot be zero")
+            continue
+
+        return value
+
+def get_float(prompt, min_value=None, allow_zero=False):
+    """
+    Get a float from the user.
+
+    Args:
+        prompt (str): The prompt message to display
+        min_value (float): Minimum allowed value
+        allow_zero (bool): Whether to allow zero as a valid input
+
+    Returns:
+        float: The validated float
+    """
+    while True:
+        # float() ignores surrounding whitespace, so the raw input is parsed as is
+        value = input(prompt)
+
+        if not value or value.isspace():
+            print("Error: Input cannot be empty")
+            continue
+
+        try:
+            value = float(value)
+        except ValueError:
+            print("Error: Please enter a valid float")
+            continue
+
+        if min_value is not None and value < min_value:
+            print(f"Error: Value must be greater than {min_value}")
+            continue
+        if not allow_zero and value == 0:
+            print("Error: Value cannot be zero")
+            continue
 
         return value
 
@@ -59,35 +116,34 @@ def display_menu():
 def display_products(products):
     """Display all products in a formatted table."""
     print("\nAvailable Products:")
-    print(f"{'ID':<5} {'Name':<20} {'Brand':<15} {'Stock':<10} {'Price(Rs)':<15} {'Origin':<15}")
-    print("-" * 80)
-    for product in products:
-        if product['stock'] > 0:
-            selling_price = product['cost_price'] * (1 + MARKUP_PERCENTAGE/100)
-            print(f"{product['id']:<5} {product['name']:<20} {product['brand']:<15} "
-                  f"{product['stock']:<10} {selling_price:<15.2f} {product['origin']:<15}")
+    print(PRODUCT_COL_HEADER)
+    print(PRODUCT_SEP)
+    in_stock = [product for product in products if product.stock > 0]
+    for product in in_stock:
+        print(PRODUCT_ROW_FMT.format(product.id, product.name, product.brand,
+                                     product.stock, product.selling_price, product.origin))
 
 def process_sale_item(product, quantity):
     """Process a single sale item and return sale details."""
     if quantity <= 0:
         return None, "Quantity must be positive"
-    if quantity > product['stock']:
-        return None, f"Only {product['stock']} items available in stock"
+    stock = product.stock
+    if quantity > stock:
+        return None, f"Only {stock} items available in stock"
 
     # Calculate free items (1 free for every 3 bought)
     free_items = quantity // 3
-    total_items = quantity + free_items
+    if quantity + free_items > stock:
+        return None, f"Not enough stock for free items. Maximum available: {stock}"
 
-    if total_items > product['stock']:
-        return None, f"Not enough stock for free items. Maximum available: {product['stock']}"
-
-    selling_price = product['cost_price'] * (1 + MARKUP_PERCENTAGE/100)
+    # Price only once the stock checks have passed
+    selling_price = product.selling_price
     item_total = quantity * selling_price
 
     return {
-        'id': product['id'],
-        'name': product['name'],
-        'brand': product['brand'],
+        'id': product.id,
+        'name': product.name,
+        'brand': product.brand,
         'quantity': quantity,
         'free_items': free_items,
         'price': selling_price,
@@ -97,10 +153,11 @@ def process_sale_item(product, quantity):
 def make_sale(product_mgr, invoice_mgr):
     """Process a sale transaction."""
     print("\n=== Make a Sale ===")
-    customer_name = get_valid_input("Enter customer name: ")
+    customer_name = get_str("Enter customer name: ")
 
-    products = product_mgr['get_all_products']()
+    products = product_mgr.products
     display_products(products)
+    by_id_get = product_mgr.get_by_id
 
     sale_items = []
     total_amount = 0
@@ -114,22 +171,12 @@ def make_sale(product_mgr, invoice_mgr):
                 print("Error: Product ID cannot be empty")
                 continue
 
-            product_id = int(product_id)
-            product = None
-            for p in products:
-                if p['id'] == product_id:
-                    product = p
-                    break
-
-            if not product:
+            product = by_id_get(int(product_id))
+            if product is None:
                 print("Error: Product ID not found")
                 continue
 
-            quantity = get_valid_input(
-                f"Enter quantity for {product['name']}: ",
-                input_type=int,
-                min_value=1
-            )
+            quantity = get_int(f"Enter quantity for {product.name}: ", min_value=1)
 
             sale_item, error = process_sale_item(product, quantity)
 
@@ -141,14 +188,17 @@ def make_sale(product_mgr, invoice_mgr):
             total_amount += sale_item['total']
 
             # Update stock
-            product_mgr['update_stock'](product['id'],
-                product['stock'] - (sale_item['quantity'] + sale_item['free_items']))
+            product_mgr.update_stock(product.id,
+                product.stock - (sale_item['quantity'] + sale_item['free_items']))
 
         except ValueError:
             print("Error: Please enter a valid number")
             continue
 
     if sale_items:
+        # Save updated stock levels
+        product_mgr.flush()
+
         # Generate sale invoice
         invoice_data = {
             'customer_name': customer_name,
@@ -156,17 +206,18 @@ def make_sale(product_mgr, invoice_mgr):
             'items': sale_items,
             'total_amount': total_amount
         }
-        invoice_mgr['generate_sale_invoice'](invoice_data)
+        invoice_mgr.generate_sale_invoice(invoice_data)
         print(f"\nSale completed! Total amount: Rs. {total_amount:.2f}")
         print("Invoice has been generated.")
 
 def restock_products(product_mgr, invoice_mgr):
     """Process a product restocking transaction."""
     print("\n=== Restock Products ===")
-    supplier_name = get_valid_input("Enter supplier name: ")
+    supplier_name = get_str("Enter supplier name: ")
 
-    products = product_mgr['get_all_products']()
+    products = product_mgr.products
     display_products(products)
+    by_id_get = product_mgr.get_by_id
 
     restock_items = []
     total_cost = 0
@@ -182,19 +233,11 @@ def restock_products(product_mgr, invoice_mgr):
                 continue
 
             if product_id.lower() == 'new':
-                name = get_valid_input("Enter new product name: ")
-                brand = get_valid_input("Enter brand name: ")
-                origin = get_valid_input("Enter country of origin: ")
-                quantity = get_valid_input(
-                    "Enter quantity: ",
-                    input_type=int,
-                    min_value=1
-                )
-                cost_price = get_valid_input(
-                    "Enter cost price per item: ",
-                    input_type=float,
-                    min_value=0.01
-                )
+                name = get_str("Enter new product name: ")
+                brand = get_str("Enter brand name: ")
+                origin = get_str("Enter country of origin: ")
+                quantity = get_int("Enter quantity: ", min_value=1)
+                cost_price = get_float("Enter cost price per item: ", min_value=0.01)
 
                 restock_items.append({
                     'id': None,  # New product, ID will be assigned by product manager
@@ -207,39 +250,28 @@ def restock_products(product_mgr, invoice_mgr):
                 total_cost += quantity * cost_price
                 continue
 
-            product_id = int(product_id)
-            product = None
-            for p in products:
-                if p['id'] == product_id:
-                    product = p
-                    break
-
-            if not product:
+            product = by_id_get(int(product_id))
+            if product is None:
                 print("Error: Product ID not found")
                 continue
 
-            quantity = get_valid_input(
-                f"Enter quantity for {product['name']}: ",
-                input_type=int,
-                min_value=1
-            )
-            cost_price = get_valid_input(
+            quantity = get_int(f"Enter quantity for {product.name}: ", min_value=1)
+            cost_price = get_float(
                 "Enter new cost price per item (or 0 to keep current): ",
-                input_type=float,
                 min_value=0,
                 allow_zero=True
             )
 
             if cost_price == 0:
-                cost_price = product['cost_price']
+                cost_price = product.cost_price
 
             restock_items.append({
-                'id': product['id'],
-                'name': product['name'],
-                'brand': product['brand'],
+                'id': product.id,
+                'name': product.name,
+                'brand': product.brand,
                 'quantity': quantity,
                 'cost_price': cost_price,
-                'origin': product['origin']
+                'origin': product.origin
             })
 
             total_cost += quantity * cost_price
@@ -250,7 +282,7 @@ def restock_products(product_mgr, invoice_mgr):
 
     if restock_items:
         # Update product file
-        product_mgr['restock_products'](restock_items)
+        product_mgr.restock_products(restock_items)
 
         # Generate restock invoice
         invoice_data = {
@@ -259,7 +291,7 @@ def restock_products(product_mgr, invoice_mgr):
             'items': restock_items,
             'total_amount': total_cost
         }
-        invoice_mgr['generate_restock_invoice'](invoice_data)
+        invoice_mgr.generate_restock_invoice(invoice_data)
         print(f"\nRestock completed! Total cost: Rs. {total_cost:.2f}")
         print("Invoice has been generated.")
 
@@ -273,8 +305,7 @@ def main():
         choice = display_menu()
 
         if choice == '1':
-            products = product_mgr['get_all_products']()
-            display_products(products)
+            display_products(product_mgr.products)
         elif choice == '2':
             make_sale(product_mgr, invoice_mgr)
         elif choice == '3':
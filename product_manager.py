@@ -5,6 +5,25 @@ This module handles all product-related operations including loading, saving,
 and managing product data in the WeCare Skin Care Product System.
 """
 
+# Constants
+MARKUP_PERCENTAGE = 200  # 200% markup
+MARKUP_MULTIPLIER = 1.0 + MARKUP_PERCENTAGE / 100.0
+PRODUCT_LINE_FMT = "{}, {}, {}, {}, {}, {}\n"
+
+class Product:
+    """A single product record with its precomputed selling price."""
+
+    __slots__ = ('id', 'name', 'brand', 'stock', 'cost_price', 'origin', 'selling_price')
+
+    def __init__(self, product_id, name, brand, stock, cost_price, origin):
+        self.id = product_id
+        self.name = name
+        self.brand = brand
+        self.stock = stock
+        self.cost_price = cost_price
+        self.origin = origin
+        self.selling_price = cost_price * MARKUP_MULTIPLIER
+
 def load_products(filename):
     """
     Load products from the given filename.
@@ -13,22 +32,11 @@ def load_products(filename):
         filename (str): The name of the file to load products from
 
     Returns:
-        list: A list of dictionaries containing product data
+        list: A list of Product objects
     """
-    products = []
     try:
         with open(filename, 'r', encoding='utf-8') as file:
-            for line in file:
-                if line.strip():
-                    id_val, name, brand, stock, cost_price, origin = line.strip().split(', ')
-                    products.append({
-                        'id': int(id_val),
-                        'name': name,
-                        'brand': brand,
-                        'stock': int(stock),
-                        'cost_price': float(cost_price),
-                        'origin': origin
-                    })
+            data = file.read()
     except FileNotFoundError:
         # Create file with sample data if it doesn't exist
         sample_data = [
@@ -39,76 +47,75 @@ def load_products(filename):
         with open(filename, 'w', encoding='utf-8') as file:
             file.write('\n'.join(sample_data))
         return load_products(filename)
-    return products
+
+    return [
+        Product(int(id_val), name, brand, int(stock), float(cost_price), origin)
+        for line in data.splitlines() if line.strip()
+        for id_val, name, brand, stock, cost_price, origin in (line.strip().split(', '),)
+    ]
 
 def save_products(products, filename):
     """
     Save products to the given filename.
 
     Args:
-        products (list): List of product dictionaries to save
+        products (list): List of Product objects to save
         filename (str): The name of the file to save products to
     """
     with open(filename, 'w', encoding='utf-8') as file:
-        for product in products:
-            line = (f"{product['id']}, {product['name']}, {product['brand']}, "
-                   f"{product['stock']}, {product['cost_price']}, {product['origin']}\n")
-            file.write(line)
-
-def get_next_id(products):
-    """Get the next available product ID."""
-    max_id = 0
-    for product in products:
-        if product['id'] > max_id:
-            max_id = product['id']
-    return max_id + 1
+        file.writelines(
+            PRODUCT_LINE_FMT.format(product.id, product.name, product.brand,
+                                    product.stock, product.cost_price, product.origin)
+            for product in products
+        )
 
-def create_product_manager(filename):
-    """Create a product manager with the given filename."""
-    # Load the products from file
-    all_products = load_products(filename)
+class ProductManager:
+    """Manages the product catalog stored in a products file."""
 
-    # Create the manager functions
-    def get_products():
-        return all_products
+    __slots__ = ('filename', 'products', 'by_id', 'get_by_id', 'next_id')
 
-    def update_product_stock(product_id, new_stock):
-        for product in all_products:
-            if product['id'] == product_id:
-                product['stock'] = new_stock
-                save_products(all_products, filename)
-                break
+    def __init__(self, filename):
+        self.filename = filename
+        # Load the products from file
+        self.products = load_products(filename)
 
-    def handle_restock(restock_items):
+        # Index products by ID for constant-time lookups
+        self.by_id = {product.id: product for product in self.products}
+        self.get_by_id = self.by_id.get
+        self.next_id = max((product.id for product in self.products), default=0) + 1
+
+    def update_stock(self, product_id, new_stock):
+        """Set the stock level of a product; call flush() to save it."""
+        product = self.by_id.get(product_id)
+        if product:
+            product.stock = new_stock
+
+    def flush(self):
+        """Save all products to the products file."""
+        save_products(self.products, self.filename)
+
+    def restock_products(self, restock_items):
+        """Apply restock items, adding new products as needed, and save."""
         for item in restock_items:
-            product_found = False
+            product = self.by_id.get(item['id'])
             # Update existing product
-            for product in all_products:
-                if product['id'] == item['id']:
-                    product['stock'] += item['quantity']
-                    product['cost_price'] = item['cost_price']
-                    product['brand'] = item['brand']
-                    product['origin'] = item['origin']
-                    product_found = True
-                    break
+            if product:
+                product.stock += item['quantity']
+                product.cost_price = item['cost_price']
+                product.selling_price = item['cost_price'] * MARKUP_MULTIPLIER
+                product.brand = item['brand']
+                product.origin = item['origin']
+                continue
 
             # Add new product
-            if not product_found:
-                new_id = get_next_id(all_products)
-                all_products.append({
-                    'id': new_id,
-                    'name': item['name'],
-                    'brand': item['brand'],
-                    'stock': item['quantity'],
-                    'cost_price': item['cost_price'],
-                    'origin': item['origin']
-                })
-        save_products(all_products, filename)
-
-    # Return the manager functions
-    return {
-        'products': all_products,
-        'get_all_products': get_products,
-        'update_stock': update_product_stock,
-        'restock_products': handle_restock
-    }
+            new_id = self.next_id
+            self.next_id += 1
+            product = Product(new_id, item['name'], item['brand'], item['quantity'],
+                              item['cost_price'], item['origin'])
+            self.products.append(product)
+            self.by_id[new_id] = product
+        self.flush()
+
+def create_product_manager(filename):
+    """Create a product manager with the given filename."""
+    return ProductManager(filename)